@@ -1,5 +1,5 @@
 import multiprocessing
-import os
+import py_compile
 from multiprocessing.connection import Connection
 from multiprocessing.context import SpawnContext, SpawnProcess
 from pathlib import Path
@@ -67,7 +67,9 @@ def run(
     )
 
     context: SpawnContext = multiprocessing.get_context("spawn")
-    processes: list[tuple[SpawnProcess, Connection]] = []
+    # (process, send_pipe, recv_pipe) per worker; the pipes are the
+    # simplex pair Worker.worker_main expects, seen from this side.
+    workers: list[tuple[SpawnProcess, Connection, Connection]] = []
 
     dist_info: list[HostInfo] = [
         HostInfo(
@@ -81,38 +83,51 @@ def run(
         for i in range(num_agents)
     ]
 
+    # Compile the training script once, as Agent does; workers execute
+    # the cached bytecode.
+    compiled_script = base_dir / tag / "script.pyc"
+    compiled_script.parent.mkdir(parents=True, exist_ok=True)
+    py_compile.compile(str(training_script), cfile=str(compiled_script), doraise=True)
+
     gpu_index = 0
     for agent_index in range(num_agents):
-        for worker_index in range(num_gpus_per_agent):
-            os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_index)
-            pipe, child_pipe = context.Pipe()
-            pipe.send(dist_info)
+        for local_rank in range(num_gpus_per_agent):
+            child_recv_pipe, send_pipe = context.Pipe(duplex=False)
+            recv_pipe, child_send_pipe = context.Pipe(duplex=False)
+            # Without a shared memory buffer attached, workers receive
+            # dist_info through the pipe.
+            send_pipe.send(dist_info)
 
             process = context.Process(
                 target=Worker.worker_main,
                 args=(
-                    child_pipe,
+                    child_recv_pipe,
+                    child_send_pipe,
+                    None,
+                    None,
+                    None,
                     agent_index,
-                    worker_index,
+                    gpu_index,
+                    local_rank,
                     tag,
                     base_dir,
-                    training_script,
-                    training_script_args,
+                    str(training_script),
+                    compiled_script,
+                    list(training_script_args),
                 ),
             )
             process.start()
-            processes.append((process, pipe))
+            workers.append((process, send_pipe, recv_pipe))
 
             gpu_index += 1
 
-    del os.environ["CUDA_VISIBLE_DEVICES"]
-
-    # Rebroadcast pipe information
-    port = processes[0][1].recv()
-    for _, pipe in processes:
-        pipe.send(port)
+    # Worker (0, 0) reports the torch.distributed rank 0 port;
+    # forward the frame to every worker as the agent does.
+    port_frame = workers[0][2].recv_bytes()
+    for _, send_pipe, _ in workers:
+        send_pipe.send_bytes(port_frame)
 
-    for process, _ in processes:
+    for process, _, _ in workers:
         process.join()
 
 
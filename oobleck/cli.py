@@ -37,7 +37,11 @@ def get_agent_list(ctx: click.core.Context):
 @click.option("--agent_index", type=int)
 def kill_agent(ctx: click.core.Context, agent_index: int):
     stub: OobleckMasterStub = ctx.obj["stub"]
-    stub.KillAgent(AgentInfo(agent_index=agent_index))
+    # The index refers to the list printed by get_agent_list; resolve it
+    # to a host identity, since the master's list changes as agents exit.
+    response: DistInfo = stub.GetDistInfo(Empty())
+    host = response.hosts[agent_index]
+    stub.KillAgent(AgentInfo(ip=host.ip, devices=host.devices, port=host.port))
 
 
 if __name__ == "__main__":
@@ -1,13 +1,20 @@
+import asyncio
+import marshal
 import multiprocessing
 import os
-import runpy
+import pickle
+import py_compile
+import struct
 import sys
-import threading
-import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-from multiprocessing.connection import Connection
-from multiprocessing.context import SpawnContext, SpawnProcess
+from operator import attrgetter
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import ForkServerContext, ForkServerProcess
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event, Semaphore
 from pathlib import Path
 from typing import cast
 
@@ -17,10 +24,14 @@ import torch
 from google.protobuf.empty_pb2 import Empty
 from loguru import logger
 
-from oobleck.elastic.master_service_pb2 import CodeInfo, DistInfo, PortInfo
+from oobleck.elastic.master_service_pb2 import AgentInfo, CodeInfo, DistInfo, PortInfo
 from oobleck.elastic.master_service_pb2_grpc import OobleckMasterStub
 from oobleck.elastic.run import HostInfo, HostStatus
-from oobleck.engine.configuration_engine import ConfigurationEngine
+from oobleck.engine.configuration_engine import (
+    MSG_IMMEDIATE_RECONFIGURE,
+    MSG_RECONFIGURE,
+    ConfigurationEngine,
+)
 
 
 @contextmanager
@@ -33,19 +44,65 @@ def temporary_argv(new_argv: list[str]):
         sys.argv = old_argv
 
 
+# Size of the per-worker shared memory buffer used to publish dist_info.
+DIST_INFO_SHM_SIZE = 1 << 16
+
+# Empty has no fields; reuse one instance instead of allocating
+# a fresh message for every RPC.
+_EMPTY = Empty()
+
+# Channel options for the long-lived streams to the master: HTTP/2
+# keepalive pings so idle streams survive NATs and dead connections are
+# detected, instead of silently stalling until the next notification.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+    ("grpc.http2.min_ping_interval_without_data_ms", 5000),
+]
+
+_host_fields = attrgetter("ip", "devices", "port", "status")
+
+
+def hosts_from_proto(hosts) -> list[HostInfo]:
+    """
+    Convert protobuf HostInfo messages into HostInfo dataclasses.
+
+    attrgetter batches the field reads through C code instead of
+    running four Python-level attribute lookups per host.
+    """
+    return [
+        HostInfo(ip, devices, port, HostStatus[status])
+        for ip, devices, port, status in map(_host_fields, hosts)
+    ]
+
+
 @dataclass
 class Worker:
-    pipe: Connection
-    process: SpawnProcess
+    # Simplex pipe ends owned by the agent: one to write to the worker,
+    # one to read from it. Simplex pipes halve the fd count per worker
+    # compared to a full-duplex socketpair.
+    send_pipe: Connection
+    recv_pipe: Connection
+    ack: Semaphore
+    process: ForkServerProcess
 
     @staticmethod
     def worker_main(
-        pipe: Connection,
+        recv_pipe: Connection,
+        send_pipe: Connection,
+        shm: SharedMemory,
+        event: Event,
+        ack: Semaphore,
         agent_index: int,
         gpu_index: int,
+        local_rank: int,
         tag: str,
         base_dir: Path,
-        script_path: Path,
+        script_path: str,
+        compiled_script: Path,
         script_args: list[str],
     ):
         """
@@ -54,6 +111,14 @@ class Worker:
         It creates ConfigurationEngine that will internally be used in
         ExecutionEngine, and execute the given code.
         """
+        # Must be set before any CUDA initialization. Setting these here
+        # instead of in the agent avoids mutating the agent's environment
+        # per spawned worker and does not depend on when the forkserver
+        # snapshots the agent environment.
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_index)
+        os.environ["TORCH_NCCL_USE_COMM_NONBLOCKING"] = "1"
+        os.environ["TORCH_NCCL_ASYNC_ERROR_HANDLING"] = "0"
+
         assert (
             torch.cuda.device_count() == 1
         ), "CUDA_VISIBLE_DEVICES must be set to a single GPU."
@@ -64,15 +129,45 @@ class Worker:
         )
 
         logger.debug(
-            f"Worker process started: (agent_index: {agent_index}, "
-            f"gpu_index: {os.environ['CUDA_VISIBLE_DEVICES']})"
+            "Worker process started: (agent_index: {}, gpu_index: {})",
+            agent_index,
+            gpu_index,
         )
 
-        ConfigurationEngine.create(pipe, agent_index, gpu_index, tag, base_dir)
+        ConfigurationEngine.create(
+            recv_pipe,
+            send_pipe,
+            agent_index,
+            local_rank,
+            tag,
+            base_dir,
+            dist_shm=shm,
+            dist_event=event,
+            dist_ack=ack,
+        )
+
+        # Execute the bytecode precompiled by the agent; this skips
+        # re-parsing and re-compiling the script on every worker start.
+        with compiled_script.open("rb") as f:
+            f.read(16)  # skip the pyc header
+            code = marshal.load(f)
+
+        module = types.ModuleType("__main__")
+        module.__dict__["__file__"] = script_path
+
+        # Install the module as __main__ while the script runs, like
+        # runpy.run_path(run_name="__main__") does; otherwise classes
+        # defined in the script cannot be unpickled (e.g. by dataloader
+        # workers) because __main__ would not contain them.
+        main_module = sys.modules["__main__"]
+        sys.modules["__main__"] = module
 
         argv = [script_path] + list(script_args)
-        with temporary_argv(argv):
-            runpy.run_path(script_path.as_posix(), run_name="__main__")
+        try:
+            with temporary_argv(argv):
+                exec(code, module.__dict__)
+        finally:
+            sys.modules["__main__"] = main_module
 
 
 class Agent:
@@ -94,42 +189,140 @@ class Agent:
         self.base_dir = base_dir
         self.stub = stub
 
+        # Workers are forked from a forkserver that imports the heavy
+        # modules once, so each worker start is a cheap fork instead of
+        # a fresh interpreter re-importing torch and friends.
+        # CUDA is only initialized in the worker, after the fork.
+        ctx: ForkServerContext = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["torch", "oobleck.elastic.agent"])
+        self.context = ctx
+
         # Get distributed information and code from the master
-        dist_info: DistInfo = stub.GetDistInfo(Empty())
-        self.dist_info = list(
-            HostInfo(host.ip, host.devices, host.port, HostStatus[host.status])
-            for host in dist_info.hosts
+        dist_info: DistInfo = stub.GetDistInfo(_EMPTY)
+        self.dist_info = hosts_from_proto(dist_info.hosts)
+
+        # This agent's own host identity. agent_index is the launch-time
+        # index and goes stale as dist_info shrinks on reconfigurations,
+        # so later lookups go through this identity instead.
+        self.host: HostInfo = self.dist_info[self.agent_index]
+
+        # A single buffer and event shared by all workers; publishing
+        # dist_info is one write + one event set regardless of the number
+        # of workers. The initial dist_info is serialized once here and
+        # the buffer is sized so that it always fits.
+        payload = HostInfo.serialize(self.dist_info)
+        self.dist_info_shm = SharedMemory(
+            create=True, size=max(DIST_INFO_SHM_SIZE, 4 + len(payload))
         )
-        training_args: CodeInfo = stub.GetCode(Empty())
-        self.script: Path = Path(training_args.path)
+        self.dist_info_event: Event = ctx.Event()
+        self.write_dist_info(self.dist_info)
+        training_args: CodeInfo = stub.GetCode(_EMPTY)
+        # Keep the script path as the str it arrives as; it is only
+        # ever consumed as a string (py_compile, __file__, argv[0]).
+        self.script: str = training_args.path
         self.script_args: list[str] = [arg for arg in training_args.args]
         self.workers: list[Worker] = []
 
+        # Number of the current launch round. Every agent increments it
+        # per forwarding round (initial launch plus each reconfiguration
+        # it survives), so it tracks the master's port generation without
+        # extra coordination.
+        self.port_generation = 0
+
+        # Compile the training script once; workers execute the cached
+        # bytecode instead of re-parsing the source on every start.
+        self.compiled_script: Path = base_dir / job_tag / "script.pyc"
+        self.compiled_script.parent.mkdir(parents=True, exist_ok=True)
+        py_compile.compile(
+            self.script, cfile=str(self.compiled_script), doraise=True
+        )
+
+    def write_dist_info(self, dist_info: list[HostInfo]) -> bool:
+        """
+        Serialize dist_info once and write it into the shared buffer.
+
+        Returns False if the payload does not fit, after writing a
+        zero-length frame that tells workers to fall back to the pipe.
+        """
+        payload = HostInfo.serialize(dist_info)
+        shm = self.dist_info_shm
+        if 4 + len(payload) > shm.size:
+            struct.pack_into("<I", shm.buf, 0, 0)
+            return False
+
+        shm.buf[4 : 4 + len(payload)] = payload
+        struct.pack_into("<I", shm.buf, 0, len(payload))
+        return True
+
+    def publish_dist_info(self, dist_info: list[HostInfo] | None = None):
+        """
+        Publish dist_info to all workers via the shared memory buffer,
+        avoiding pickle and a per-worker copy through the pipe.
+
+        The buffer is written once and a single event wakes all workers.
+        The agent waits for every worker to acknowledge the read before
+        clearing the event so that the buffer can be reused.
+
+        If dist_info is None, the frame already present in the buffer
+        (the initial dist_info written at initialization) is published
+        without serializing again.
+
+        Acknowledgements are waited for with a timeout: a worker that
+        died before acking (e.g. after a peer failure triggered the
+        reconfiguration in the first place) must not wedge the agent on
+        its semaphore forever.
+        """
+        fits = True if dist_info is None else self.write_dist_info(dist_info)
+        self.dist_info_event.set()
+        if not fits:
+            # Pickle once and fan the bytes out, instead of pickling
+            # the same list again for every worker.
+            payload = pickle.dumps(dist_info)
+            for worker in self.workers:
+                worker.send_pipe.send_bytes(payload)
+
+        for worker in self.workers:
+            while not worker.ack.acquire(timeout=1):
+                if not worker.process.is_alive():
+                    logger.warning(
+                        f"Worker {worker.process.pid} died without acking dist_info."
+                    )
+                    break
+        self.dist_info_event.clear()
+
     def notify_reconfiguration_to_workers(
         self, dist_info: list[HostInfo], immediate_restart: bool
     ):
         logger.warning(
             f"Reconfiguration request received from master: {dist_info}. Sending to workers"
         )
+        message = struct.pack(
+            "<B", MSG_IMMEDIATE_RECONFIGURE if immediate_restart else MSG_RECONFIGURE
+        )
         for worker in self.workers:
-            worker.pipe.send(
-                "immediate_reconfigure" if immediate_restart else "reconfigure"
-            )
-            worker.pipe.send(dist_info)
-
-        # If this agent is about to die, don't forward the port
-        if dist_info[self.agent_index].status == HostStatus.terminating:
+            worker.send_pipe.send_bytes(message)
+        self.publish_dist_info(dist_info)
+
+        # If this agent is about to die, don't forward the port.
+        # Find ourselves by identity; our position in dist_info shifts
+        # as earlier-indexed hosts drop out.
+        my_host = next((host for host in dist_info if host == self.host), None)
+        if my_host is None or my_host.status == HostStatus.terminating:
             return
 
         self.forward_master_port()
 
-    def watch_reconfiguration_notification(self):
-        for dist_info in self.stub.WatchReconfigurationNotification(Empty()):
+    async def watch_reconfiguration_notification(self, stub: OobleckMasterStub):
+        """
+        Watch reconfiguration notifications from the master.
+
+        The stream is driven by the asyncio event loop; unlike the
+        synchronous API there is no thread blocked inside gRPC and
+        the stream does not have to be resubscribed per notification.
+        """
+        async for dist_info in stub.WatchReconfigurationNotification(_EMPTY):
             dist_info = cast(DistInfo, dist_info)
-            dist_info = [
-                HostInfo(host.ip, host.devices, host.port, HostStatus[host.status])
-                for host in dist_info.hosts
-            ]
+            dist_info = hosts_from_proto(dist_info.hosts)
 
             immediate_restart = False
             if any(host.status == HostStatus.killed for host in dist_info):
@@ -145,50 +338,68 @@ class Agent:
                 for host_info in dist_info
                 if host_info.status != HostStatus.killed
             ]
-            self.notify_reconfiguration_to_workers(self.dist_info, immediate_restart)
+            # The notify path blocks on worker acks and synchronous gRPC;
+            # run it in a thread so the event loop (and cancellation of
+            # this task) stays responsive.
+            await asyncio.to_thread(
+                self.notify_reconfiguration_to_workers, self.dist_info, immediate_restart
+            )
 
     def run_profiler(self):
         raise NotImplementedError()
 
     def launch_workers(self):
         """Launch worker processes."""
-        ctx: SpawnContext = multiprocessing.get_context("spawn")
+        ctx = self.context
 
         gpu_indices: list[int] = list(
             int(dev) for dev in self.dist_info[self.agent_index].devices.split(",")
         )
 
+        # Precompute one (gpu_index, local_rank, global_rank) tuple per
+        # worker; the enumeration position is the local rank, so no
+        # per-worker arithmetic is re-derived in the launch loop.
         tensor_parallel_size = len(gpu_indices)
-        ranks = range(
-            self.agent_index * tensor_parallel_size,
-            (self.agent_index + 1) * tensor_parallel_size,
-        )
+        plan = [
+            (gpu_index, local_rank, self.agent_index * tensor_parallel_size + local_rank)
+            for local_rank, gpu_index in enumerate(gpu_indices)
+        ]
 
-        os.environ["TORCH_NCCL_USE_COMM_NONBLOCKING"] = "1"
-        os.environ["TORCH_NCCL_ASYNC_ERROR_HANDLING"] = "0"
-        for gpu_index, rank in zip(gpu_indices, ranks):
+        def launch_worker(gpu_index: int, local_rank: int, rank: int) -> Worker:
             logger.info(f"Launching worker {rank} (GPU: {gpu_index})...")
 
-            pipe, child_pipe = ctx.Pipe()
+            child_recv_pipe, send_pipe = ctx.Pipe(duplex=False)
+            recv_pipe, child_send_pipe = ctx.Pipe(duplex=False)
+            ack = ctx.Semaphore(0)
 
-            os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu_index)
-            process: SpawnProcess = ctx.Process(
+            process: ForkServerProcess = ctx.Process(
                 target=Worker.worker_main,
                 args=(
-                    child_pipe,
+                    child_recv_pipe,
+                    child_send_pipe,
+                    self.dist_info_shm,
+                    self.dist_info_event,
+                    ack,
                     self.agent_index,
-                    gpu_index % tensor_parallel_size,
+                    gpu_index,
+                    local_rank,
                     self.tag,
                     self.base_dir,
                     self.script,
+                    self.compiled_script,
                     self.script_args,
                 ),
                 daemon=False,
             )
             process.start()
-            self.workers.append(Worker(pipe, process))
-            pipe.send(self.dist_info)
-        del os.environ["CUDA_VISIBLE_DEVICES"]
+            return Worker(send_pipe, recv_pipe, ack, process)
+
+        # Spawning a worker costs hundreds of milliseconds; overlap the
+        # spawns instead of starting them one by one.
+        with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+            self.workers = list(executor.map(launch_worker, *zip(*plan)))
+
+        self.publish_dist_info()
 
         self.forward_master_port()
 
@@ -200,35 +411,64 @@ class Agent:
         If this is the first agent, it should send the rank 0 port
         from its first worker to master too.
         """
+        self.port_generation += 1
+
         # If this is the first agent, it should forward the master rank port
         if self.agent_index == 0:
             logger.debug("Waiting for rank 0 port...")
-            port: int = self.workers[0].pipe.recv()
-            logger.debug(f"Received rank 0 port: {port}. Sending it to master.")
+            (port,) = struct.unpack("<I", self.workers[0].recv_pipe.recv_bytes())
+            logger.debug("Received rank 0 port: {}. Sending it to master.", port)
             self.stub.SetMasterRankPort(PortInfo(port=port))
 
-        port: int = 0
-        while port == 0:
-            time.sleep(0.1)
-            port = self.stub.GetMasterRankPort(Empty()).port
+        # The stream blocks until this round's port is set; no polling
+        # is involved, and agents that subscribe after the port was set
+        # get it immediately.
+        port: int = next(
+            self.stub.WatchMasterRankPort(PortInfo(generation=self.port_generation))
+        ).port
 
+        message = struct.pack("<I", port)
         for worker in self.workers:
-            worker.pipe.send(port)
-
-        # Master rank will send another message to the agent to reset the port
-        if self.agent_index == 0:
-            self.workers[0].pipe.recv()
-            self.stub.SetMasterRankPort(PortInfo(port=0))
+            worker.send_pipe.send_bytes(message)
 
     def watch_worker_exit(self):
-        """Watch worker exit and restart it.
-        TODO: It must detect ANY worker exit, not just the first one."""
-        for worker in self.workers:
-            worker.process.join()
-            if worker.process.exitcode != 0:
-                logger.warning(
-                    f"Worker {worker.process.pid} exited with code {worker.process.exitcode}."
+        """Watch worker exit.
+
+        A single wait over all process sentinels detects ANY worker exit
+        immediately, instead of joining workers one by one and only
+        noticing an exit of worker N after workers 0..N-1 exited.
+
+        On the first abnormal exit the remaining workers are terminated
+        and the master is asked to remove this agent, so reconfiguration
+        starts immediately instead of after every worker died on its own.
+        """
+        remaining: list[Worker] = list(self.workers)
+        failed = False
+        while remaining and not failed:
+            ready = wait([worker.process.sentinel for worker in remaining])
+            for worker in [w for w in remaining if w.process.sentinel in ready]:
+                worker.process.join()
+                if worker.process.exitcode != 0:
+                    logger.warning(
+                        f"Worker {worker.process.pid} exited with code {worker.process.exitcode}."
+                    )
+                    failed = True
+                remaining.remove(worker)
+
+        if failed and remaining:
+            logger.warning("Terminating remaining workers and reporting to master.")
+            for worker in remaining:
+                worker.process.terminate()
+            self.stub.KillAgent(
+                AgentInfo(
+                    ip=self.host.ip, devices=self.host.devices, port=self.host.port
                 )
+            )
+            for worker in remaining:
+                worker.process.join()
+
+        self.dist_info_shm.close()
+        self.dist_info_shm.unlink()
         logger.info("All workers exited.")
 
 
@@ -242,20 +482,27 @@ class Agent:
 )
 def run(master_ip: str, master_port: int, agent_index: int, tag: str, base_dir: Path):
     # Connect to the master
-    channel = grpc.insecure_channel(f"{master_ip}:{master_port}")
+    channel = grpc.insecure_channel(
+        f"{master_ip}:{master_port}", options=_CHANNEL_OPTIONS
+    )
     stub = OobleckMasterStub(channel)
 
     agent = Agent(agent_index, tag, base_dir, stub)
     agent.launch_workers()
 
-    def watch_reconfiguration_noti_func():
-        while True:
-            agent.watch_reconfiguration_notification()
-
-    thread = threading.Thread(target=watch_reconfiguration_noti_func, daemon=True)
-    thread.start()
+    async def main():
+        # One event loop drives both the reconfiguration stream and the
+        # worker sentinel wait; no dedicated watcher thread is needed.
+        async with grpc.aio.insecure_channel(
+            f"{master_ip}:{master_port}", options=_CHANNEL_OPTIONS
+        ) as aio_channel:
+            watcher = asyncio.create_task(
+                agent.watch_reconfiguration_notification(OobleckMasterStub(aio_channel))
+            )
+            await asyncio.to_thread(agent.watch_worker_exit)
+            watcher.cancel()
 
-    agent.watch_worker_exit()
+    asyncio.run(main())
     logger.info(f"Agent {agent_index} exited.")
 
 
@@ -2,8 +2,8 @@
 """Client and server classes corresponding to protobuf-defined services."""
 
 import grpc
-from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 import oobleck.elastic.master_service_pb2 as master__service__pb2
 
 
@@ -31,9 +31,9 @@ class OobleckMasterStub(object):
             request_serializer=master__service__pb2.PortInfo.SerializeToString,
             response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
         )
-        self.GetMasterRankPort = channel.unary_unary(
-            "/OobleckMaster/GetMasterRankPort",
-            request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+        self.WatchMasterRankPort = channel.unary_stream(
+            "/OobleckMaster/WatchMasterRankPort",
+            request_serializer=master__service__pb2.PortInfo.SerializeToString,
             response_deserializer=master__service__pb2.PortInfo.FromString,
         )
         self.WatchReconfigurationNotification = channel.unary_stream(
@@ -69,7 +69,7 @@ class OobleckMasterServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
-    def GetMasterRankPort(self, request, context):
+    def WatchMasterRankPort(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
@@ -105,9 +105,9 @@ def add_OobleckMasterServicer_to_server(servicer, server):
             request_deserializer=master__service__pb2.PortInfo.FromString,
             response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
         ),
-        "GetMasterRankPort": grpc.unary_unary_rpc_method_handler(
-            servicer.GetMasterRankPort,
-            request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+        "WatchMasterRankPort": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchMasterRankPort,
+            request_deserializer=master__service__pb2.PortInfo.FromString,
             response_serializer=master__service__pb2.PortInfo.SerializeToString,
         ),
         "WatchReconfigurationNotification": grpc.unary_stream_rpc_method_handler(
@@ -219,7 +219,7 @@ class OobleckMaster(object):
         )
 
     @staticmethod
-    def GetMasterRankPort(
+    def WatchMasterRankPort(
         request,
         target,
         options=(),
@@ -231,11 +231,11 @@ class OobleckMaster(object):
         timeout=None,
         metadata=None,
     ):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
-            "/OobleckMaster/GetMasterRankPort",
-            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            "/OobleckMaster/WatchMasterRankPort",
+            master__service__pb2.PortInfo.SerializeToString,
             master__service__pb2.PortInfo.FromString,
             options,
             channel_credentials,
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import multiprocessing
 import socket
+import struct
 import sys
+import threading
 from concurrent import futures
 from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
@@ -59,7 +61,7 @@ class HostStatus(Enum):
     terminating = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class HostInfo:
     ip: str
     devices: str
@@ -76,6 +78,48 @@ class HostInfo:
     def __hash__(self) -> int:
         return hash((self.ip, self.devices, self.port))
 
+    @staticmethod
+    def serialize(hosts: list[HostInfo]) -> bytes:
+        """
+        Serialize a list of HostInfo into a compact binary frame.
+
+        Unlike pickle, the frame has no per-object overhead so it can
+        directly be written into a shared memory buffer.
+        """
+        frames: list[bytes] = [struct.pack("<I", len(hosts))]
+        for host in hosts:
+            ip = host.ip.encode()
+            devices = host.devices.encode()
+            frames.append(
+                struct.pack(
+                    "<HHIB", len(ip), len(devices), host.port, host.status.value
+                )
+            )
+            frames.append(ip)
+            frames.append(devices)
+        return b"".join(frames)
+
+    @staticmethod
+    def deserialize(data: bytes | memoryview) -> list[HostInfo]:
+        """Deserialize a binary frame created by `HostInfo.serialize`."""
+        (num_hosts,) = struct.unpack_from("<I", data, 0)
+        offset = 4
+
+        hosts: list[HostInfo] = []
+        header_size = struct.calcsize("<HHIB")
+        for _ in range(num_hosts):
+            ip_len, devices_len, port, status = struct.unpack_from(
+                "<HHIB", data, offset
+            )
+            offset += header_size
+            ip = bytes(data[offset : offset + ip_len]).decode()
+            offset += ip_len
+            devices = bytes(data[offset : offset + devices_len]).decode()
+            offset += devices_len
+            hosts.append(HostInfo(ip, devices, port, HostStatus(status)))
+
+        return hosts
+
     @staticmethod
     def fetch_hostfile(hostfile_path: Path) -> list[HostInfo]:
         """
@@ -287,6 +331,15 @@ class MasterService(master_service_pb2_grpc.OobleckMasterServicer):
         self.script_args = script_args
         self.disconnect_condition = disconnect_condition
         self.master_port = 0
+        # Incremented on every SetMasterRankPort call. Each launch (or
+        # reconfiguration) round sets the port exactly once, so agents
+        # ask for "generation >= my round" and always get the port of
+        # their own round, whether they subscribe before or after it
+        # was set.
+        self.master_port_generation = 0
+        # Rung when the master rank port is set so that blocked
+        # WatchMasterRankPort streams can push it to agents.
+        self.master_port_condition = threading.Condition()
 
     def GetDistInfo(
         self,
@@ -320,24 +373,54 @@ class MasterService(master_service_pb2_grpc.OobleckMasterServicer):
         request: master_service_pb2.PortInfo,
         context: grpc.RpcContext,
     ) -> empty_pb2.Empty:
-        self.master_port = request.port
+        with self.master_port_condition:
+            self.master_port = request.port
+            self.master_port_generation += 1
+            self.master_port_condition.notify_all()
         return empty_pb2.Empty()
 
-    def GetMasterRankPort(
+    def WatchMasterRankPort(
         self,
-        request: empty_pb2.Empty,
+        request: master_service_pb2.PortInfo,
         context: grpc.RpcContext,
-    ) -> master_service_pb2.PortInfo:
-        return master_service_pb2.PortInfo(port=self.master_port)
+    ):
+        """
+        Block until the port of `request.generation` (or a newer one) is
+        set and push it to the agent. Unlike polling, one RPC delivers
+        the port as soon as it is available; agents that subscribe after
+        the port was set get it immediately instead of blocking.
+
+        The wait is bounded so that a disconnected client does not park
+        a server thread forever.
+        """
+        with self.master_port_condition:
+            while self.master_port_generation < request.generation:
+                if not context.is_active():
+                    return
+                self.master_port_condition.wait(timeout=1)
+            port = self.master_port
+            generation = self.master_port_generation
+
+        if context.is_active():
+            yield master_service_pb2.PortInfo(port=port, generation=generation)
 
     def KillAgent(
         self, request: master_service_pb2.AgentInfo, context: grpc.RpcContext
     ) -> empty_pb2.Empty:
-        agent_index = request.agent_index
-        host, _ = agent_list[agent_index]
+        # Look the agent up by host identity; agent_list shrinks as
+        # agents exit, so any index taken at launch time can point at
+        # the wrong host here.
+        target = HostInfo(request.ip, request.devices, request.port)
+        host = next((host for host, _ in agent_list if host == target), None)
+
+        if host is None:
+            logger.warning(
+                f"KillAgent request for unknown agent on {target.ip}:{target.port}"
+            )
+            return empty_pb2.Empty()
 
         host.status = HostStatus.terminating
-        logger.info(f"Terminating agent {agent_index} on {host.ip}:{host.port}")
+        logger.info(f"Terminating agent on {host.ip}:{host.port}")
 
         with self.disconnect_condition:
             self.disconnect_condition.notify_all()
@@ -349,10 +432,21 @@ class MasterService(master_service_pb2_grpc.OobleckMasterServicer):
         request: empty_pb2.Empty,
         context: grpc.RpcContext,
     ):
-        with self.disconnect_condition:
-            self.disconnect_condition.wait()
+        # The stream is long-lived: one notification is pushed per
+        # disconnect event so agents do not have to resubscribe.
+        # The wait is bounded so the handler notices a gone client (or a
+        # stopped server) and returns, instead of parking a non-daemon
+        # executor thread in wait() until a wake that never comes.
+        while True:
+            with self.disconnect_condition:
+                notified = self.disconnect_condition.wait(timeout=1)
+
+            if not context.is_active():
+                return
+
+            if not notified:
+                continue
 
-        if context.is_active():
             yield master_service_pb2.DistInfo(
                 hosts=[
                     master_service_pb2.HostInfo(
@@ -3,7 +3,10 @@ from __future__ import annotations
 import datetime
 import itertools
 import os
+import struct
 from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event, Semaphore
 from pathlib import Path
 
 import torch.distributed as dist
@@ -11,18 +14,28 @@ from loguru import logger
 
 from oobleck.elastic.run import HostInfo, HostStatus
 
+# Message types for the framed control messages exchanged with the agent.
+# Control messages are fixed-shape and struct-packed instead of pickled.
+MSG_RECONFIGURE = 1
+MSG_IMMEDIATE_RECONFIGURE = 2
+
 
 class ConfigurationEngine:
     """
     An engine that manages internal configurations and distributed of Oobleck.
     This is the only engine in a worker process that communicates with an agent process.
-    Communication with the agent is done via a pipe.
+    Communication with the agent is done via a pair of simplex pipes,
+    one per direction.
     Users should not touch this class manually.
     """
 
     _instance: ConfigurationEngine = None
 
-    pipe: Connection
+    recv_pipe: Connection
+    send_pipe: Connection
+    dist_shm: SharedMemory | None
+    dist_event: Event | None
+    dist_ack: Semaphore | None
     agent_index: int
     tag: str
     base_dir: Path
@@ -38,11 +51,15 @@ class ConfigurationEngine:
 
     @staticmethod
     def create(
-        pipe: Connection,
+        recv_pipe: Connection,
+        send_pipe: Connection,
         agent_index: int,
         local_rank: int,
         tag: str,
         base_dir: Path,
+        dist_shm: SharedMemory | None = None,
+        dist_event: Event | None = None,
+        dist_ack: Semaphore | None = None,
     ) -> ConfigurationEngine:
         """Create a new instance of ConfigurationEngine."""
         if ConfigurationEngine._instance is not None:
@@ -51,16 +68,20 @@ class ConfigurationEngine:
         instance = ConfigurationEngine.__new__(ConfigurationEngine)
 
         # TODO: set initial attributes.
-        instance.pipe = pipe
+        instance.recv_pipe = recv_pipe
+        instance.send_pipe = send_pipe
+        instance.dist_shm = dist_shm
+        instance.dist_event = dist_event
+        instance.dist_ack = dist_ack
         instance.agent_index = agent_index
         instance.tag = tag
         instance.base_dir = base_dir
 
         instance.local_rank = local_rank
-        dist_info: list[HostInfo] = pipe.recv()
+        dist_info: list[HostInfo] = instance._recv_dist_info()
         instance.dist_info = dist_info
 
-        logger.debug(f"dist_info: {dist_info}, agent_index: {agent_index}")
+        logger.debug("dist_info: {}, agent_index: {}", dist_info, agent_index)
 
         instance.rank_map = {
             host: list(range(i * len(gpu_indices), (i + 1) * len(gpu_indices)))
@@ -70,7 +91,7 @@ class ConfigurationEngine:
         my_agent = dist_info[agent_index]
         instance.rank = instance.rank_map[my_agent][instance.local_rank]
 
-        logger.debug(f"rank_map: {instance.rank_map}")
+        logger.debug("rank_map: {}", instance.rank_map)
 
         ConfigurationEngine._instance = instance
         return ConfigurationEngine._instance
@@ -82,12 +103,39 @@ class ConfigurationEngine:
         ), "ConfigurationEngine is not initialized."
         return ConfigurationEngine._instance
 
+    def _recv_dist_info(self) -> list[HostInfo]:
+        """
+        Receive a list of HostInfo from the agent process.
+
+        If a shared memory buffer is attached, read the serialized frame
+        from it to avoid pickle; otherwise (or if the agent signaled
+        a fallback with a zero-length frame), receive it from the pipe.
+
+        The buffer is shared among all workers of the agent; each worker
+        acknowledges its read so the agent knows when it can be reused.
+        """
+        if self.dist_shm is None:
+            return self.recv_pipe.recv()
+
+        self.dist_event.wait()
+        (size,) = struct.unpack_from("<I", self.dist_shm.buf, 0)
+        if size == 0:
+            # The payload did not fit in the buffer; the agent sent it
+            # through the pipe instead.
+            dist_info = self.recv_pipe.recv()
+        else:
+            dist_info = HostInfo.deserialize(
+                memoryview(self.dist_shm.buf)[4 : 4 + size]
+            )
+        self.dist_ack.release()
+        return dist_info
+
     def get_host_update(self):
         """
         Get host update from the agent process.
         """
         my_agent = self.dist_info[self.agent_index]
-        new_dist_info: list[HostInfo] = self.pipe.recv()
+        new_dist_info: list[HostInfo] = self._recv_dist_info()
 
         assert not any(
             host.status == HostStatus.killed for host in new_dist_info
@@ -146,10 +194,10 @@ class ConfigurationEngine:
             False if some agents wll be terminated after the iteration.
         """
         try:
-            message = self.pipe.recv()
-            if message == "immediate_reconfigure":
+            (message,) = struct.unpack("<B", self.recv_pipe.recv_bytes())
+            if message == MSG_IMMEDIATE_RECONFIGURE:
                 return True
-            elif message == "reconfigure":
+            elif message == MSG_RECONFIGURE:
                 return False
 
             raise ValueError(f"Unexpected reconfiguration message: {message}")
@@ -158,10 +206,11 @@ class ConfigurationEngine:
             os._exit(1)
 
     def send_distributed_port(self, port: int):
-        self.pipe.send(port)
+        self.send_pipe.send_bytes(struct.pack("<I", port))
 
     def receive_distributed_port(self) -> int:
-        return self.pipe.recv()
+        (port,) = struct.unpack("<I", self.recv_pipe.recv_bytes())
+        return port
 
     def init_distributed(self):
         """
@@ -187,17 +236,14 @@ class ConfigurationEngine:
                 is_master=True,
                 wait_for_workers=False,
             )
-            logger.debug(f"torch rank 0 port: {store.port}")
+            logger.debug("torch rank 0 port: {}", store.port)
             self.send_distributed_port(store.port)
             # this distributed port is broadcasted and event this process receives it.
             # For master it is useless, so just discard it.
             self.receive_distributed_port()
-
-            # Send anything to the agent back to ask to reset the port
-            self.pipe.send(0)
         else:
             port = self.receive_distributed_port()
-            logger.debug(f"Received torch.distributed rank 0 port: {port}")
+            logger.debug("Received torch.distributed rank 0 port: {}", port)
             store = dist.TCPStore(
                 host_name=self.dist_info[0].ip,
                 port=port,
@@ -207,8 +253,9 @@ class ConfigurationEngine:
             )
 
         logger.debug(
-            "Initializing torch.distributed. "
-            f"rank: {self.rank}, world size: {self.world_size}"
+            "Initializing torch.distributed. rank: {}, world size: {}",
+            self.rank,
+            self.world_size,
         )
 
         dist.init_process_group(
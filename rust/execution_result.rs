@@ -65,22 +65,9 @@ pub struct StageExecutionResult {
 }
 
 impl StageExecutionResult {
-    pub fn new(layers: &[LayerExecutionResult]) -> Self {
-        let mut forward = 0.0;
-        let mut backward = 0.0;
-        let mut mem_required = 0;
-
-        for layer in layers {
-            forward += layer.forward;
-            backward += layer.backward;
-            mem_required += layer.mem_required;
-        }
-
+    pub fn new(layers: (u32, u32), forward: f64, backward: f64, mem_required: u64) -> Self {
         StageExecutionResult {
-            layers: (
-                layers[0].layer_index,
-                layers[layers.len() - 1].layer_index + 1,
-            ),
+            layers,
             forward,
             backward,
             mem_required,
@@ -35,11 +35,32 @@ impl PipelineTemplateGenerator {
             return Err(PlannerError::new("Invalid number of nodes"));
         }
 
+        // Prefix sums over the profile so that the cost of any contiguous
+        // layer range [i, j) is a single subtraction instead of an O(j - i)
+        // summation inside the O(L^2) base-case loop below.
+        let mut prefix_forward = vec![0.0_f64; num_layers + 1];
+        let mut prefix_backward = vec![0.0_f64; num_layers + 1];
+        let mut prefix_mem = vec![0_u64; num_layers + 1];
+        for (index, layer) in self.layer_execution_results.iter().enumerate() {
+            prefix_forward[index + 1] = prefix_forward[index] + layer.forward;
+            prefix_backward[index + 1] = prefix_backward[index] + layer.backward;
+            prefix_mem[index + 1] = prefix_mem[index] + layer.mem_required;
+        }
+        let prefix_forward = &prefix_forward;
+        let prefix_backward = &prefix_backward;
+        let prefix_mem = &prefix_mem;
+
         // Put all base cases in the cache
         (0..num_layers).into_par_iter().for_each(|i| {
             ((i + 1)..=num_layers).into_par_iter().for_each(|j| {
                 let stage_execution_result = Arc::new(StageExecutionResult::new(
-                    &self.layer_execution_results[i..j],
+                    (
+                        self.layer_execution_results[i].layer_index,
+                        self.layer_execution_results[j - 1].layer_index + 1,
+                    ),
+                    prefix_forward[j] - prefix_forward[i],
+                    prefix_backward[j] - prefix_backward[i],
+                    prefix_mem[j] - prefix_mem[i],
                 ));
                 log::debug!(
                     "StageExecutionResult({}, {})  -> {}",
@@ -20,14 +20,24 @@ fake_host_info = [
 ]
 
 
-@pytest.fixture()
-def server(
-    tmp_path: Path,
+@pytest.fixture(scope="session")
+def grpc_server(
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> tuple[LaunchArguments, ScriptArguments, MasterService, int]:
+    """
+    Build the gRPC stack once per session.
+
+    Server bring-up costs ~100ms; only mutable service state differs
+    between tests, and the function-scoped `server` fixture resets it.
+    """
+    tmp_path = tmp_path_factory.mktemp("elastic")
+
     fake_launch_args = LaunchArguments(
         hostfile=Path(tmp_path / "hostfile"),
         tag="test-gpt2",
+        master_service_port=0,
         base_dir=tmp_path,
+        debug=False,
     )
 
     fake_launch_args.hostfile.write_text(
@@ -54,7 +64,6 @@ def server(
     )
 
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
-    run.agent_list = [(host, None) for host in fake_host_info]
     service = MasterService(
         fake_script_args,
         multiprocessing.get_context("spawn").Condition(),
@@ -65,3 +74,20 @@ def server(
 
     yield fake_launch_args, fake_script_args, service, port
     server.stop(grace=None)
+
+
+@pytest.fixture()
+def server(
+    grpc_server: tuple[LaunchArguments, ScriptArguments, MasterService, int],
+) -> tuple[LaunchArguments, ScriptArguments, MasterService, int]:
+    _, _, service, _ = grpc_server
+
+    # Tests mutate agent_list (and the HostInfo instances in it) and the
+    # master rank port; rebuild that state so tests stay independent.
+    run.agent_list = [
+        (HostInfo(host.ip, host.devices, host.port), None) for host in fake_host_info
+    ]
+    service.master_port = 0
+    service.master_port_generation = 0
+
+    yield grpc_server
@@ -1,5 +1,9 @@
 import multiprocessing
+import py_compile
+import struct
 from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event, Semaphore
 from pathlib import Path
 from unittest.mock import patch
 
@@ -25,25 +29,35 @@ def reset_configuration_engine():
 
 
 def worker_main_forward_master_port(
-    pipe: Connection,
+    recv_pipe: Connection,
+    send_pipe: Connection,
+    shm: SharedMemory,
+    event: Event,
+    ack: Semaphore,
     agent_index: int,
     gpu_index: int,
+    local_rank: int,
     tag: str,
     base_dir: Path,
-    code: bytes,
+    script_path: str,
+    compiled_script: Path,
     args: list[str],
 ):
-    if agent_index == 0:
-        pipe.send(4321)
-
-    # Receive distributed info
-    dist_info = pipe.recv()
+    # Only the master rank worker reports its port to the agent.
+    if agent_index == 0 and local_rank == 0:
+        send_pipe.send_bytes(struct.pack("<I", 4321))
+
+    # Receive distributed info from the shared memory buffer
+    event.wait()
+    (size,) = struct.unpack_from("<I", shm.buf, 0)
+    dist_info = HostInfo.deserialize(memoryview(shm.buf)[4 : 4 + size])
+    ack.release()
     assert isinstance(dist_info, list)
     assert all(isinstance(host_info, HostInfo) for host_info in dist_info)
 
     # Receive port info
-    port = pipe.recv()
-    pipe.send(port)
+    port = recv_pipe.recv_bytes()
+    send_pipe.send_bytes(port)
 
 
 def test_agent_forward_master_port(
@@ -65,10 +79,12 @@ def test_agent_forward_master_port(
     ):
         agent1.launch_workers()
 
+    # The agent drained agent 0 worker 0's port report; the only message
+    # left per worker is the broadcast port echoed back by the fake worker.
     for agent in [agent0, agent1]:
         for worker in agent.workers:
             worker.process.join()
-            assert worker.pipe.recv() == 4321
+            assert struct.unpack("<I", worker.recv_pipe.recv_bytes()) == (4321,)
 
 
 @pytest.mark.parametrize("gpu_index", [0, 1, 2, 6])
@@ -80,7 +96,13 @@ def test_worker_main_init_configuration_engine(
     master_args, script_args, _, _ = server
     run.agent_list.clear()
 
-    pipe, child_pipe = multiprocessing.Pipe()
+    compiled_script = master_args.base_dir / "script.pyc"
+    py_compile.compile(
+        str(script_args.training_script), cfile=str(compiled_script), doraise=True
+    )
+
+    child_recv_pipe, pipe = multiprocessing.Pipe(duplex=False)
+    _, child_send_pipe = multiprocessing.Pipe(duplex=False)
     hosts = HostInfo.fetch_hostfile(master_args.hostfile)
     pipe.send(hosts)
 
@@ -93,23 +115,35 @@ def test_worker_main_init_configuration_engine(
         if gpu_index >= 2:
             with pytest.raises(IndexError):
                 Worker.worker_main(
-                    child_pipe,
+                    child_recv_pipe,
+                    child_send_pipe,
+                    None,
+                    None,
+                    None,
                     0,
                     gpu_index,
+                    gpu_index,
                     master_args.tag,
                     master_args.base_dir,
-                    script_args.training_script,
+                    str(script_args.training_script),
+                    compiled_script,
                     script_args.training_script_args,
                 )
             return
 
         Worker.worker_main(
-            child_pipe,
+            child_recv_pipe,
+            child_send_pipe,
+            None,
+            None,
+            None,
             0,
+            gpu_index,
             1,
             master_args.tag,
             master_args.base_dir,
-            script_args.training_script,
+            str(script_args.training_script),
+            compiled_script,
             script_args.training_script_args,
         )
 
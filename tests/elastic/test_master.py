@@ -12,6 +12,7 @@ from pytest_mock import MockerFixture
 from oobleck.elastic import master_service_pb2, master_service_pb2_grpc, run
 from oobleck.elastic.run import (
     HostInfo,
+    HostStatus,
     LaunchArguments,
     MasterService,
     MultiNodeAgentRunner,
@@ -60,6 +61,36 @@ def test_get_code(
     )
 
 
+def test_watch_master_rank_port(
+    server: tuple[LaunchArguments, ScriptArguments, MasterService, int],
+):
+    _, _, _, port = server
+    stub = get_stub(port)
+
+    from queue import Queue
+
+    queue = Queue()
+
+    def run_watcher(queue: Queue):
+        queue.put(
+            next(
+                stub.WatchMasterRankPort(master_service_pb2.PortInfo(generation=1))
+            ).port
+        )
+
+    threading.Thread(target=run_watcher, args=(queue,), daemon=True).start()
+
+    # The watcher must block until the port is set.
+    stub.SetMasterRankPort(master_service_pb2.PortInfo(port=4321))
+    assert queue.get(timeout=10) == 4321
+
+    # A watcher that subscribes after the port was set must still
+    # receive the port of its round instead of blocking.
+    late = next(stub.WatchMasterRankPort(master_service_pb2.PortInfo(generation=1)))
+    assert late.port == 4321
+    assert late.generation == 1
+
+
 def test_receive_reconfiguration_notification(
     server: tuple[LaunchArguments, ScriptArguments, MasterService, int],
 ):
@@ -95,6 +126,27 @@ def test_receive_reconfiguration_notification(
         assert host.port == fake_host.port
 
 
+def test_kill_agent_after_agent_departure(
+    server: tuple[LaunchArguments, ScriptArguments, MasterService, int],
+):
+    _, _, _, port = server
+    stub = get_stub(port)
+
+    # Simulate an agent that exited earlier, so that launch-time indices
+    # no longer match positions in agent_list.
+    run.agent_list.pop(0)
+
+    target, _ = run.agent_list[-1]
+    stub.KillAgent(
+        master_service_pb2.AgentInfo(
+            ip=target.ip, devices=target.devices, port=target.port
+        )
+    )
+
+    assert target.status == HostStatus.terminating
+    assert all(host.status == HostStatus.up for host, _ in run.agent_list[:-1])
+
+
 def test_run_agents(
     server: tuple[LaunchArguments, ScriptArguments, MasterService, int],
     mocker: MockerFixture,
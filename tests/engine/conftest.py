@@ -61,7 +61,8 @@ class OobleckMultiprocessTestBase(MultiProcessTestCase):
         if self.backend == "nccl":
             torch.cuda.set_device(self.rank)
 
-        pipe, child_pipe = multiprocessing.Pipe()
+        child_recv_pipe, pipe = multiprocessing.Pipe(duplex=False)
+        recv_pipe, child_send_pipe = multiprocessing.Pipe(duplex=False)
         # dist info
         pipe.send(
             [
@@ -72,10 +73,12 @@ class OobleckMultiprocessTestBase(MultiProcessTestCase):
             ]
         )
         self.pipe = pipe
+        self.recv_pipe = recv_pipe
 
         temp_dir = Path(os.environ["TEMP_DIR"])
         ConfigurationEngine.create(
-            child_pipe,
+            child_recv_pipe,
+            child_send_pipe,
             self.rank // self.tp_size,
             self.rank % self.tp_size,
             tag,
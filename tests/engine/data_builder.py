@@ -1,7 +1,11 @@
 # Coda copied from colossalai/examples/language/gpt/hybridparallelism/data.py
 
+import tempfile
+from pathlib import Path
+
 import datasets
 from colossalai.booster.plugin.dp_plugin_base import DPPluginBase
+from filelock import FileLock
 from transformers import AutoTokenizer, PreTrainedTokenizer
 
 
@@ -65,18 +69,27 @@ class GLUEDataBuilder:
 
     def setup(self):
         self.tokenizer.pad_token = self.tokenizer.eos_token
-        self.dataset = datasets.load_dataset("glue", self.task_name)
 
-        for split in self.dataset.keys():
-            self.dataset[split] = self.dataset[split].map(
-                self.convert_to_features,
-                batched=True,
-                remove_columns=["label"],
-            )
-            self.columns = [
-                c for c in self.dataset[split].column_names if c in self.loader_columns
-            ]
-            self.dataset[split].set_format(type="torch", columns=self.columns)
+        # Every spawned test rank builds the dataset; serialize the HF
+        # download and tokenization so ranks with a cold cache do not
+        # race on the same cache files and download redundantly. Once
+        # warm, each rank only pays a cache read under the lock.
+        lock_path = Path(tempfile.gettempdir()) / f"oobleck-glue-{self.task_name}.lock"
+        with FileLock(lock_path):
+            self.dataset = datasets.load_dataset("glue", self.task_name)
+
+            for split in self.dataset.keys():
+                self.dataset[split] = self.dataset[split].map(
+                    self.convert_to_features,
+                    batched=True,
+                    remove_columns=["label"],
+                )
+                self.columns = [
+                    c
+                    for c in self.dataset[split].column_names
+                    if c in self.loader_columns
+                ]
+                self.dataset[split].set_format(type="torch", columns=self.columns)
 
         self.eval_splits = [x for x in self.dataset.keys() if "validation" in x]
 
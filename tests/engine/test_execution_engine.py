@@ -1,6 +1,7 @@
+import struct
 import sys
 import time
-from copy import deepcopy
+from dataclasses import replace
 from typing import Counter
 from unittest.mock import patch
 
@@ -33,7 +34,11 @@ from transformers import (
 )
 
 from oobleck.elastic.run import HostInfo, HostStatus
-from oobleck.engine.configuration_engine import ConfigurationEngine
+from oobleck.engine.configuration_engine import (
+    MSG_IMMEDIATE_RECONFIGURE,
+    MSG_RECONFIGURE,
+    ConfigurationEngine,
+)
 from oobleck.engine.execution_engine import ExecutionEngine
 from oobleck.engine.plugin import OobleckPlugin
 
@@ -260,13 +265,15 @@ class TestEngineExecutionClass(OobleckEngineTestBase):
                 for host_info in configuration_engine.dist_info
                 if host_info.port not in hosts_to_fail
             ]
-            self.pipe.send("immediate_reconfigure")
+            self.pipe.send_bytes(struct.pack("<B", MSG_IMMEDIATE_RECONFIGURE))
         else:
-            new_host_info: list[HostInfo] = deepcopy(configuration_engine.dist_info)
+            new_host_info: list[HostInfo] = [
+                replace(host_info) for host_info in configuration_engine.dist_info
+            ]
             for host_info in new_host_info:
                 if host_info.port in hosts_to_fail:
                     host_info.status = HostStatus.terminating
-            self.pipe.send("reconfigure")
+            self.pipe.send_bytes(struct.pack("<B", MSG_RECONFIGURE))
         self.pipe.send(new_host_info)
 
         while engine.notification_receiver_thread.is_alive():
@@ -1,5 +1,4 @@
 import itertools
-from pathlib import Path
 
 import pytest
 from cornstarch.pipeline_template import PipelineTemplate
@@ -20,9 +19,13 @@ tp_size = 1
 precision = "fp32"
 
 
-@pytest.fixture
-def profile_data(tmp_path: Path) -> list[LayerExecutionResult]:
-    profile_dir_path = tmp_path / tag / "profile"
+@pytest.fixture(scope="module")
+def profile_data(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> list[LayerExecutionResult]:
+    # The profile content is constant and both tests only read it;
+    # materialize it once per module instead of per test.
+    profile_dir_path = tmp_path_factory.mktemp(tag) / "profile"
     init_profile_data(
         profile_dir=profile_dir_path,
         tp_size=tp_size,
@@ -44,11 +44,15 @@ class TestProfileModelClass(MultiProcessTestCase):
         super().tearDown()
 
     def init_configuration_engine(self, temp_dir: Path):
-        pipe, child_pipe = multiprocessing.Pipe()
+        child_recv_pipe, pipe = multiprocessing.Pipe(duplex=False)
+        recv_pipe, child_send_pipe = multiprocessing.Pipe(duplex=False)
         # dist info
         pipe.send([HostInfo("127.0.0.1", self.world_size, 1234)])
         self.pipe = pipe
-        ConfigurationEngine.create(child_pipe, 0, self.rank, tag, temp_dir)
+        self.recv_pipe = recv_pipe
+        ConfigurationEngine.create(
+            child_recv_pipe, child_send_pipe, 0, self.rank, tag, temp_dir
+        )
 
     def init_distributed(self):
         print(f"dist init r={self.rank}, world={self.world_size}")